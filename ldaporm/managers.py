@@ -1,13 +1,31 @@
 from base64 import b64encode as encode
 from collections import namedtuple
-from distutils.version import StrictVersion
+from contextlib import contextmanager
+import copy
 from functools import wraps
 import hashlib
+import itertools
 import logging
+import operator
 import os
+import queue
 import re
 import threading
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Type, Sequence, cast
+import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Sequence,
+    Union,
+    cast,
+)
 
 from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
@@ -15,6 +33,9 @@ from django.core.exceptions import ImproperlyConfigured
 import ldap
 from ldap import modlist
 from ldap.controls import SimplePagedResultsControl
+from ldap.controls.libldap import AssertionControl
+from ldap.controls.sss import SSSRequestControl
+from ldap.dn import escape_dn_chars
 from ldap_filter import Filter
 
 
@@ -25,7 +46,9 @@ if TYPE_CHECKING:
     from .models import Model
     from .options import Options  # noqa:F401
 
-LDAP24API = StrictVersion(ldap.__version__) >= StrictVersion('2.4')
+# The special attribute name which tells the LDAP server to return no
+# attributes at all for the entries matched by a search (RFC 4511, 4.5.1.8)
+NO_ATTRIBUTES = '1.1'
 logger = logging.getLogger('django-ldaporm')
 
 
@@ -46,23 +69,18 @@ def atomic(key: str = 'read') -> Callable:
 
     If 'key' is "write", do this operation on the LDAP server we've designated
     as our read-write server.
+
+    If we already have a connection in this thread that will do for ``key``,
+    we use that; see :py:meth:`LdapManager.connection_scope`.
     """
     def real_decorator(func: Callable) -> Callable:
         @wraps(func)
         def wrapper(self, *args, **kwargs) -> Callable:
-            # add the LDAP server url to our logging context
-            if self.has_connection():
-                # Ensure we're not currently in a wrapped function
+            # connection_scope() cleans up the connection no matter what
+            # happens in func(), and never lets a write go over a connection
+            # to our read-only server
+            with self.connection_scope(key):
                 return func(self, *args, **kwargs)
-            self.connect(key)
-            try:
-                retval = func(self, *args, **kwargs)
-            finally:
-                # We do this in a finally: branch so that the ldap
-                # connection and logger gets cleaned up no matter what
-                # happens in func()
-                self.disconnect()
-            return retval
         return wrapper
     return real_decorator
 
@@ -106,6 +124,116 @@ def needs_pk(func: Callable) -> Callable:
 # -----------------------
 
 
+class LdapConnectionPool:
+    """
+    A thread-safe pool of bound LDAP connections.
+
+    Connections are made by ``factory`` the first time they are needed and are
+    kept around after use, so that we don't have to do the TCP connect, TLS
+    negotiation and LDAP bind for every operation.  At most ``size`` idle
+    connections are kept; any others are unbound when they are released.
+
+    You don't use this directly: set ``pool_size`` in the "read" and/or "write"
+    section of ``settings.LDAP_SERVERS`` and :py:class:`LdapManager` will use
+    a pool for connections bound with those credentials::
+
+        LDAP_SERVERS = {
+            'default': {
+                'basedn': 'o=example,c=us',
+                'read': {
+                    'url': 'ldap://ldap.example.com',
+                    'user': 'cn=readonly',
+                    'password': 'password',
+                    'pool_size': 8,
+                },
+                ...
+            }
+        }
+
+    You may also set ``pool_idle_check`` there, to change how many seconds a
+    connection may sit idle in the pool before we check that it still works.
+
+    Args:
+        factory: a callable that returns a new bound ``LDAPObject``
+
+    Keyword Args:
+        size: the maximum number of idle connections to keep
+        idle_check: check connections that have been idle for longer than
+            this many seconds before handing them out
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], ldap.ldapobject.LDAPObject],
+        size: int = 8,
+        idle_check: float = 30.0
+    ) -> None:
+        self.factory = factory
+        self.size = size
+        self.idle_check = idle_check
+        # (time released, connection) pairs
+        self._idle: queue.LifoQueue = queue.LifoQueue(maxsize=size)
+
+    def acquire(self) -> ldap.ldapobject.LDAPObject:
+        """
+        Return an idle connection from the pool, or a new one if there are
+        none.  Connections that have been idle for longer than
+        ``self.idle_check`` seconds are checked with a "Who am I?" extended
+        operation first, and thrown away if the server has dropped them.
+
+        Returns:
+            A bound ``LDAPObject``.
+        """
+        while True:
+            try:
+                released, ldap_object = self._idle.get_nowait()
+            except queue.Empty:
+                return self.factory()
+            if time.monotonic() - released <= self.idle_check:
+                return ldap_object
+            try:
+                ldap_object.whoami_s()
+            except ldap.LDAPError:
+                self.discard(ldap_object)
+                continue
+            return ldap_object
+
+    def release(self, ldap_object: ldap.ldapobject.LDAPObject) -> None:
+        """
+        Return ``ldap_object`` to the pool.  If the pool is already full,
+        unbind it instead.
+        """
+        try:
+            self._idle.put_nowait((time.monotonic(), ldap_object))
+        except queue.Full:
+            self.discard(ldap_object)
+
+    def discard(self, ldap_object: ldap.ldapobject.LDAPObject) -> None:
+        """
+        Unbind ``ldap_object`` without returning it to the pool.
+        """
+        try:
+            ldap_object.unbind_s()
+        except ldap.LDAPError:
+            pass
+
+
+# The exceptions that mean an LDAP connection itself is broken, rather than
+# that an operation we did on it failed.  We don't give connections that
+# raised these back to their pool.
+CONNECTION_ERRORS = (
+    ldap.SERVER_DOWN,    # pylint:disable=no-member
+    ldap.CONNECT_ERROR,  # pylint:disable=no-member
+    ldap.TIMEOUT,        # pylint:disable=no-member
+    ldap.UNAVAILABLE,    # pylint:disable=no-member
+)
+
+# Our connection pools, keyed by (url, bind dn), so that managers which talk
+# to the same server as the same user share a pool.
+_pools: Dict[Tuple[str, str], LdapConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
 class Modlist:
 
     def __init__(self, manager: "LdapManager") -> None:
@@ -128,9 +256,9 @@ class Modlist:
         `add_s` and return it.
         """
         data = obj.to_db()
-        if hasattr(obj, 'objectclass'):
+        try:
             data[1]['objectclass'] = obj.objectclass  # type: ignore
-        else:
+        except AttributeError:
             raise ImproperlyConfigured("Tried to add an object with no objectclasses defined.")
         # We have to do these two casts because LdapManager.model and
         # Model._meta start out as None.  By the time we get here the metaclass
@@ -167,6 +295,15 @@ class Modlist:
         servers because they now enforce rules for attributes that are optional
         but can't have a null value.
 
+        If ``'delta_modify'`` is in our model's ``Meta.ldap_options``, changes to
+        multi-valued attributes are sent as a ldap.MOD_DELETE of just the
+        removed values plus a ldap.MOD_ADD of just the added values, instead of
+        a ldap.MOD_REPLACE of every value.  For attributes with many values
+        (e.g. the ``memberUid`` of a large group) this keeps the size of the
+        modify proportional to the change, not to the size of the attribute.
+        Your LDAP server must have an EQUALITY matching rule for those
+        attributes.
+
         :param new: the data for the object we have
         :type new: an LDAP ORM object
 
@@ -191,21 +328,46 @@ class Modlist:
             field = _fields_map[_attribute_lookup[key]]
             if not field.editable:
                 continue
-
-            if old_data[1][key] != value:
-                changes[key] = value
+            # LDAP attribute values are unordered sets, so a multi-valued
+            # attribute whose values were merely reordered or repeated has not
+            # actually changed and should not cause a write
+            if set(old_data[1][key]) != set(value):
+                # LDAP rejects duplicate values in a modify, so drop them here,
+                # preserving the order of the remaining values
+                changes[key] = list(dict.fromkeys(value))
 
         # Now build the ldap.MOD_DELETE and ldap.MOD_REPLACE modlists
         deletes: Dict[str, Any] = {}
         replacements: Dict[str, Any] = {}
+        deltas: ModifyDeleteModList = []
+        use_deltas = 'delta_modify' in self.manager.ldap_options
         for key, value in changes.items():
+            old_value = old_data[1][key]
             if value == [] or all(x is None for x in value):
                 deletes[key] = None
+            elif use_deltas and old_value and (len(old_value) > 1 or len(value) > 1):
+                deltas.extend(self._get_value_deltas(key, old_value, value))
             else:
                 replacements[key] = value
         d_modlist = self._get_modlist(deletes, ldap.MOD_DELETE)
         r_modlist = self._get_modlist(replacements, ldap.MOD_REPLACE)
-        return r_modlist + d_modlist
+        return r_modlist + deltas + d_modlist
+
+    def _get_value_deltas(self, key: str, old: List[bytes], new: List[bytes]) -> ModifyDeleteModList:
+        """
+        Return the ldap.MOD_DELETE and ldap.MOD_ADD modlist entries that turn
+        the values ``old`` of attribute ``key`` into the values ``new``.
+        """
+        old_values = set(old)
+        new_values = set(new)
+        removed = [v for v in old if v not in new_values]
+        added = [v for v in new if v not in old_values]
+        _modlist: ModifyDeleteModList = []
+        if removed:
+            _modlist.append((ldap.MOD_DELETE, key, removed))  # type: ignore
+        if added:
+            _modlist.append((ldap.MOD_ADD, key, added))  # type: ignore
+        return _modlist
 
 
 # ========================================
@@ -213,6 +375,21 @@ class Modlist:
 # ========================================
 
 
+def _iexact_lookup(attribute: str, value: Any) -> Any:
+    if value is None:
+        # If value is None, we search for the absence of that attribute
+        return Filter.NOT(Filter.attribute(attribute).present())
+    return Filter.attribute(attribute).equal_to(value)
+
+
+def _in_lookup(attribute: str, value: Any) -> Any:
+    if not isinstance(value, (list, tuple, set, frozenset)):
+        raise ValueError('When using the "__in" filter you must supply a list, tuple or set')
+    # Drop duplicate values so that we don't send the LDAP server redundant
+    # equality tests; dict.fromkeys() preserves order
+    return Filter.OR([Filter.attribute(attribute).equal_to(v) for v in dict.fromkeys(value)])
+
+
 class F:
 
     # need to be able to specify field name and lookup db_column in LDAP
@@ -226,6 +403,19 @@ class F:
     class UnboundFilter(Exception):
         pass
 
+    #: Map filter suffixes to functions which take an LDAP attribute name and
+    #: a value and return the corresponding LDAP filter component.  We do this
+    #: once here rather than testing each suffix in turn on every .filter()
+    LOOKUPS: Dict[str, Callable[[str, Any], Any]] = {
+        'iexact': _iexact_lookup,
+        'istartswith': lambda attribute, value: Filter.attribute(attribute).starts_with(value),
+        'iendswith': lambda attribute, value: Filter.attribute(attribute).ends_with(value),
+        'icontains': lambda attribute, value: Filter.attribute(attribute).contains(value),
+        'in': _in_lookup,
+        # This one doesn't exist as a Django field lookup
+        'exists': lambda attribute, value: Filter.attribute(attribute).present(),
+    }
+
     def __init__(self, manager: "LdapManager", f: "F" = None) -> None:
         self.manager = manager
         self.model = cast(Type["Model"], manager.model)
@@ -236,7 +426,10 @@ class F:
         self.attributes = self._meta.attributes
         self._attributes = self.attributes
         self._order_by = self._meta.ordering
-        if f:
+        # The results of our search, once we've iterated over ourselves.  Any
+        # method that changes the search resets this.
+        self._result_cache: Optional[List["Model"]] = None
+        if f is not None:
             self.chain: List["F"] = f.chain
         else:
             self.chain = []
@@ -255,7 +448,7 @@ class F:
             return self.chain[0]
         return Filter.AND(self.chain).simplify()
 
-    def __sort(self, objects: Sequence["Model"]) -> Sequence["Model"]:
+    def __sort(self, objects: Sequence[Any], get: Callable[[Any, str], Any] = getattr) -> Sequence[Any]:
         """
         This is called by methods that return lists of results.  Sort our
         ``objects``, a list of objects of class ``self.manager.model`` based
@@ -274,6 +467,10 @@ class F:
         Args:
             objects: the sequence of Model instances to sort
 
+        Keyword Args:
+            get: the function to use to get the value of a field from one of
+                ``objects``.  Pass ``operator.getitem`` to sort dictionaries.
+
         Returns:
             The sorted version of ``objects``
         """
@@ -281,25 +478,77 @@ class F:
             return objects
         if not any(k.startswith('-') for k in self._order_by):
             # if none of the keys are reversed, just sort directly
-            return sorted(objects, key=lambda obj: tuple(getattr(obj, k) for k in self._order_by))
+            return sorted(objects, key=lambda obj: tuple(get(obj, k) for k in self._order_by))
         # At least one key was reversed. now we have to do it the hard way,
         # with sequential sorts, starting from the last sort key and working
         # our way back to the first
         keys = list(self._order_by)
         keys.reverse()
+        data = list(objects)
         for k in keys:
             key = k
             reverse = False
             if key.startswith('-'):
                 key = k[1:]
                 reverse = True
-            data = sorted(
-                objects,
-                key=lambda obj: getattr(obj, key),  # pylint: disable=cell-var-from-loop
+            # Python's sort is stable, so each pass keeps the order of the
+            # previous passes for objects that compare equal on this key
+            data.sort(
+                key=lambda obj: get(obj, key),  # pylint: disable=cell-var-from-loop
                 reverse=reverse
             )
         return data
 
+    def __sort_keys(self) -> List[str]:
+        """
+        Return our ``order_by`` fields as LDAP server side sort keys: the LDAP
+        attribute name, prefixed with "-" for descending order.
+        """
+        keys = []
+        for key in self._order_by:
+            if key.startswith('-'):
+                keys.append('-' + self.get_attribute(key[1:]))
+            else:
+                keys.append(self.get_attribute(key))
+        return keys
+
+    def __with_ordering_attributes(self, attributes: List[str]) -> List[str]:
+        """
+        Return ``attributes`` plus the LDAP attributes for any of our
+        ``order_by`` fields not already in it, so that we can sort the results
+        of a search that only asked for ``attributes``.
+        """
+        attributes = list(attributes)
+        for key in self._order_by:
+            attribute = self.get_attribute(key[1:] if key.startswith('-') else key)
+            if attribute not in attributes:
+                attributes.append(attribute)
+        return attributes
+
+    def __search_values(self, attributes: List[str]) -> Sequence[Dict[str, Any]]:
+        """
+        Search for only ``attributes`` (plus any we need for ordering) and
+        return a sorted list of dictionaries mapping field names, plus ``dn``,
+        to values.  We don't build model instances for these, since our
+        callers only want the values.
+
+        If ``attributes`` is empty, we were only asked for ``dn``, so ask the
+        LDAP server for no attributes at all.
+        """
+        search_attrs = self.__with_ordering_attributes(attributes)
+        data = self.manager.search(str(self), search_attrs or [NO_ATTRIBUTES])
+        # As with a model instance, a field whose attribute the object doesn't
+        # have gets its default value
+        fields = [self.fields_map[self.attribute_to_field_name_map[attr]] for attr in search_attrs]
+        rows = []
+        for dn, values in self.model.values_from_db(search_attrs, data):
+            for field in fields:
+                if field.name not in values:
+                    values[cast(str, field.name)] = field.get_default()
+            values['dn'] = dn
+            rows.append(values)
+        return self.__sort(rows, get=operator.getitem)
+
     def __validate_positional_args(self, args: Sequence["F"]) -> List["F"]:
         if args:
             for arg in args:
@@ -361,7 +610,7 @@ class F:
             * ``__istartswith``
             * ``__iendswith``
             * ``__icontains``
-            * ``__in``
+            * ``__in`` (a list, tuple or set of values; duplicates are ignored)
 
         We do support one additional LDAP specific filter: ``__exists``.  This
         will cause a filter to be added that just ensures that the returned
@@ -375,40 +624,46 @@ class F:
             versions to remind you of that.
 
         """
-        steps = self.__validate_positional_args(args)
+        self.chain.append(Filter.AND(self.__get_steps(args, kwargs)))
+        self._result_cache = None
+        return self
+
+    def exclude(self, *args: "F", **kwargs) -> "F":
+        """
+        The opposite of :py:meth:`filter`: only return objects which do *not*
+        match all of the given filters.  This takes the same arguments as
+        :py:meth:`filter`.
+
+        Example:
+
+            >>> LDAPUser.objects.exclude(uid__in=group.member_uids).values_list('uid', flat=True)
+
+        Use this to have the LDAP server leave out the objects you don't want,
+        rather than retrieving them all and discarding them in Python.
+        """
+        self.chain.append(Filter.NOT(Filter.AND(self.__get_steps(args, kwargs))))
+        self._result_cache = None
+        return self
+
+    def __get_steps(self, args: Sequence["F"], kwargs: Dict[str, Any]) -> List[Any]:
+        """
+        Convert the arguments to :py:meth:`filter` or :py:meth:`exclude` into
+        a list of LDAP filter components.
+        """
+        steps: List[Any] = self.__validate_positional_args(args)
         for key, value in kwargs.items():
             if isinstance(value, str):
                 value = value.strip()
-            if key.endswith('__istartswith'):
-                steps.append(Filter.attribute(self.get_attribute(key[:-13])).starts_with(value))
-            elif key.endswith('__iendswith'):
-                steps.append(Filter.attribute(self.get_attribute(key[:-11])).ends_with(value))
-            elif key.endswith('__icontains'):
-                steps.append(Filter.attribute(self.get_attribute(key[:-11])).contains(value))
-            elif key.endswith('__in'):
-                if not isinstance(value, list):
-                    raise ValueError('When using the "__in" filter you must supply a list')
-                in_steps = []
-                for v in value:
-                    in_steps.append(Filter.attribute(self.get_attribute(key[:-4])).equal_to(v))
-                steps.append(Filter.OR(in_steps))
-            elif key.endswith('__exists'):
-                # This one doesn't exist as a Django field lookup
-                steps.append(Filter.attribute(self.get_attribute(key[:-8])).present())
-            elif key.endswith('__iexact') or '__' not in key:
-                # no suffix means do an __exact
-                if '__' in key:
-                    key = key[:-8]
-                if value is None:
-                    # If value is None, we search for the absence of that
-                    # attribute
-                    steps.append(Filter.NOT(Filter.attribute(self.get_attribute(key))))
-                else:
-                    steps.append(Filter.attribute(self.get_attribute(key)).equal_to(value))
-            else:
-                raise F.UnknownSuffix('The search filter "{}" uses an unknown filter suffix')
-        self.chain.append(Filter.AND(steps))
-        return self
+            # no suffix means do an __iexact
+            name, _, suffix = key.partition('__')
+            if name == 'pk':
+                name = cast(str, self.manager.pk)
+            try:
+                lookup = self.LOOKUPS[suffix or 'iexact']
+            except KeyError:
+                raise F.UnknownSuffix('The search filter "{}" uses an unknown filter suffix'.format(key))
+            steps.append(lookup(self.get_attribute(name), value))
+        return steps
 
     def only(self, *names) -> "F":
         """
@@ -422,6 +677,7 @@ class F:
         :type names: list ot strings
         """
         self._attributes = [self.get_attribute(name) for name in names]
+        self._result_cache = None
         return self
 
     @needs_pk
@@ -442,64 +698,247 @@ class F:
             But, this allows us to ask LDAP for just one object, which is fast.
 
             If you do have an .order_by() filter, you'll get the first object after
-            sorting.  But LDAP servers won't do any sorting for you, so in this
+            sorting.  Most LDAP servers won't do any sorting for you, so in this
             case we retrieve all objects matching our search filters and just return
             the first one, which may be expensive.
+
+            If your LDAP server supports the server side sort control (RFC
+            2891), add ``'server_side_sort'`` to your model's
+            ``Meta.ldap_options`` and we'll have the server do the sorting and
+            send us just the first object.  Note that the server sorts by the
+            LDAP matching rules for each attribute, so e.g. string attributes
+            will be sorted case insensitively.
         """
         sizelimit = 0
+        sort_keys = None
         if not self._order_by:
             # We can just take the default LDAP ordering, so just take the first
             # result in whatever order the LDAP server keeps it in.
             sizelimit = 1
-        objects = self.manager.search(str(self), self._attributes, sizelimit=sizelimit)
+        elif 'server_side_sort' in self.manager.ldap_options:
+            sizelimit = 1
+            sort_keys = self.__sort_keys()
+        attributes = self.__with_ordering_attributes(self._attributes)
+        objects = self.manager.search(str(self), attributes, sizelimit=sizelimit, sort_keys=sort_keys)
         if len(objects) == 0:
             raise self.model.DoesNotExist(
                 'A {} object matching query does not exist.'.format(self.model.__name__))
-        objects = self.model.from_db(self._attributes, objects)
-        if not self._order_by:
+        objects = self.model.from_db(attributes, objects, many=True)
+        if sizelimit:
             return objects[0]
         return self.__sort(objects)[0]
 
     @needs_pk
-    def get(self) -> "Model":
-        objects = self.manager.search(str(self), self._attributes)
+    def get(self, *args: "F", **kwargs) -> "Model":
+        """
+        Return the single object that matches our filters.  As with Django's
+        ``QuerySet.get()``, you may pass additional filters as arguments, which
+        lets you do projections like::
+
+            >>> LDAPGroup.objects.only('cn', 'gid_number').get(cn='staff')
+
+        Raises:
+            self.model.DoesNotExist: no object matched our filters
+            self.model.MultipleObjectsReturned: more than one object matched our filters
+        """
+        f = self
+        if args or kwargs:
+            # Filter a copy, so that a projection like the one above can be
+            # reused for more than one .get()
+            f = self._clone().filter(*args, **kwargs)
+        objects = self.manager.search(str(f), f._attributes)
         if len(objects) == 0:
             raise self.model.DoesNotExist(
                 'A {} object matching query does not exist.'.format(self.model.__name__))
         if len(objects) > 1:
             raise self.model.MultipleObjectsReturned(
                 'More than one {} object matched query.'.format(self.model.__name__))
-        return cast("Model", self.model.from_db(self._attributes, objects))
+        return cast("Model", self.model.from_db(f._attributes, objects))
 
     @needs_pk
     def update(self, **kwargs) -> None:
+        """
+        Set the fields named in ``kwargs`` to the associated values on the
+        single object that matches our filters, and save it to LDAP.
+
+        If the object already has those values, we don't write to LDAP at all.
+
+        Raises:
+            self.model.InvalidField: one of the keys in ``kwargs`` is not a
+                field on our model
+        """
+        for key in kwargs:
+            self.get_attribute(key)
         obj = self.get()
-        # FIXME: obj.dump() does not exist;
-        new = self.model.from_db(self._attributes, obj.dump())
+        # Reuse the object we just got as the "old" version of the object
+        # rather than having self.manager.modify() fetch it again
+        old = copy.deepcopy(obj)
+        changed = False
         for key, value in kwargs.items():
-            if key in self.attributes:
-                setattr(new, key, value)
-        self.manager.modify(new, old=obj)
+            if getattr(obj, key) != value:
+                setattr(obj, key, value)
+                changed = True
+        if changed:
+            self.manager.modify(obj, old=old)
 
     def exists(self) -> bool:
         """
         Return ``True`` if the LDAP search with the filter we've built returns
         any results, ``False`` if not.
 
+        We ask the LDAP server for at most one entry and for no attributes at
+        all, so this is much cheaper than retrieving the objects themselves.
+
         :rtype: boolean
         """
-        objects = self.manager.search(str(self), self._attributes)
+        if self._result_cache is not None:
+            return bool(self._result_cache)
+        objects = self.manager.search(str(self), [NO_ATTRIBUTES], sizelimit=1)
         return len(objects) > 0
 
+    def count(self) -> int:
+        """
+        Return the number of objects that match our filters.
+
+        If we've already done our search (e.g. by iterating over ourselves),
+        we just count the results we have.  Otherwise we ask the LDAP server
+        for the matching entries with no attributes, which is much cheaper
+        than retrieving the objects themselves, and count them as they arrive
+        rather than keeping them.  If our model has ``'paged_search'`` in
+        ``Meta.ldap_options``, this means we hold at most one page of entries
+        at a time.
+
+        A Django ``Paginator`` uses this in preference to ``len()``, so that
+        it can then get each page with a size limited search.
+        """
+        if self._result_cache is not None:
+            return len(self._result_cache)
+        return sum(1 for _ in self.manager.search_iter(str(self), [NO_ATTRIBUTES]))
+
     @needs_pk
-    def all(self) -> Sequence["Model"]:
+    def all(self, sizelimit: int = 0) -> Sequence["Model"]:
+        """
+        Run our search and return all the matching objects, sorted by our
+        ``order_by`` fields.
+
+        Keyword Args:
+            sizelimit: if non-zero, return at most this many objects.  This
+                is applied by the LDAP server *before* we sort, so only use
+                this with an ``order_by`` if any ``sizelimit`` objects will do.
+        """
         objects = self.model.from_db(
             self._attributes,
-            self.manager.search(str(self), self._attributes),
+            self.manager.search(str(self), self._attributes, sizelimit=sizelimit),
             many=True
         )
         return self.__sort(cast(Sequence["Model"], objects))
 
+    @needs_pk
+    def iterator(self, chunk_size: int = 100) -> Iterator["Model"]:
+        """
+        Yield the matching objects, building the model instances
+        ``chunk_size`` at a time rather than all at once.  Unless our model has
+        ``'paged_search'`` in ``Meta.ldap_options``, we still get all the raw
+        LDAP entries from the server up front; with it, we only ask the server
+        for ``chunk_size`` entries at a time, so we never hold all of them in
+        memory.
+
+        Each call uses its own LDAP connection (see
+        :py:meth:`LdapManager.search_iter`), so you can interleave several
+        iterations and save objects while iterating.
+
+        Example:
+
+            >>> for user in LDAPUser.objects.order_by().iterator(chunk_size=1000):
+            ...     print(user.uid)
+
+        Note:
+            We can't sort objects that we haven't retrieved yet, so if we have
+            any ``order_by`` fields (including ``Meta.ordering``), this
+            retrieves and sorts all the objects first, just like :py:meth:`all`.
+            Use ``.order_by()`` with no arguments to clear the ordering.
+
+        Keyword Args:
+            chunk_size: the number of objects to retrieve and build at a time
+        """
+        if self._order_by:
+            yield from self.all()
+            return
+        entries = self.manager.search_iter(str(self), self._attributes, pagesize=chunk_size)
+        while True:
+            chunk = list(itertools.islice(entries, chunk_size))
+            if not chunk:
+                break
+            yield from cast(Sequence["Model"], self.model.from_db(self._attributes, chunk, many=True))
+
+    def _clone(self) -> "F":
+        """
+        Return a copy of ourselves which can be filtered further without
+        affecting us.
+        """
+        f = F(self.manager)
+        f.chain = list(self.chain)
+        f._attributes = list(self._attributes)
+        f._order_by = list(self._order_by)
+        return f
+
+    def in_bulk(
+        self,
+        id_list: Sequence[Any],
+        field_name: str = 'pk',
+        batch_size: Optional[int] = None
+    ) -> Dict[Any, "Model"]:
+        """
+        Return a dictionary mapping each value of ``field_name`` to the object
+        with that value.  All the objects are retrieved with a single LDAP
+        search (or one search per ``batch_size`` values), so use this instead
+        of looping over ``id_list`` and doing a ``.get()`` for each value.
+
+        Example:
+
+            >>> LDAPUser.objects.in_bulk(['barney', 'fred'], field_name='uid')
+            {'barney': <LDAPUser: ...>, 'fred': <LDAPUser: ...>}
+
+        Values in ``id_list`` with no corresponding object are simply absent
+        from the returned dictionary.
+
+        Note:
+            LDAP matches values case insensitively, so the keys of the returned
+            dictionary are the values as stored in LDAP, which may differ in
+            case from the values in ``id_list``.
+
+        Args:
+            id_list: the values of ``field_name`` to look for
+
+        Keyword Args:
+            field_name: the name of the field to match ``id_list`` against.
+                This should be a field with unique values.
+            batch_size: if provided, look up at most this many values per
+                LDAP search.  Use this to keep the search filter to a size
+                your LDAP server is happy with when ``id_list`` is very long.
+
+        Returns:
+            A dictionary of ``field_name`` values to model instances.
+        """
+        if field_name == 'pk':
+            field_name = cast(str, self.manager.pk)
+        # Coalesce duplicate values so that we look each one up only once
+        values = list(dict.fromkeys(id_list))
+        if not values:
+            return {}
+        attribute = self.get_attribute(field_name)
+        if attribute not in self._attributes:
+            self._attributes = self._attributes + [attribute]
+        if not batch_size:
+            batch_size = len(values)
+        results: Dict[Any, "Model"] = {}
+        with self.manager.connection_scope():
+            for i in range(0, len(values), batch_size):
+                batch = values[i:i + batch_size]
+                objects = self._clone().filter(**{'{}__in'.format(field_name): batch}).all()
+                results.update((getattr(obj, field_name), obj) for obj in objects)
+        return results
+
     def delete(self) -> None:
         """
         Delete an object that matches our filters.
@@ -534,6 +973,7 @@ class F:
                     '"{}" is not a valid field on model {}'.format(_key, self.model.__name__)
                 )
         self._order_by = list(args)
+        self._result_cache = None
         return self
 
     def values(self, *attrs: str) -> List[Dict[str, Any]]:
@@ -554,6 +994,9 @@ class F:
             >>> Entry.objects.values('uid', 'sn')
             [{'uid': 'Barney', 'sn': 'Rubble'}, {'uid': 'Fred', 'sn': 'Flintstone'}, ...]
 
+        You may also ask for ``dn``, which LDAP returns with every entry
+        without our having to ask for it.
+
         Note:
             We're trying to model how the Django ORM works here, so
             ``.values()`` is not compatible with :py:meth:`only`.  If previously
@@ -567,15 +1010,15 @@ class F:
         """
         if self._attributes != self.attributes:
             raise NotImplementedError("Don't use .only() with .values()")
-        _attrs = []
         if not attrs:
             _attrs = self.attributes
-        objects = self.model.from_db(_attrs, self.manager.search(str(self), _attrs), many=True)
-        objects = self.__sort(cast(Sequence["Model"], objects))
-        data = []
-        for obj in objects:
-            data.append({self.attribute_to_field_name_map[attr]: getattr(obj, attr) for attr in _attrs})
-        return data
+            names = [self.attribute_to_field_name_map[attr] for attr in _attrs]
+        else:
+            # Only ask LDAP for the attributes we were asked for
+            _attrs = [self.get_attribute(attr) for attr in attrs if attr != 'dn']
+            names = list(attrs)
+        rows = self.__search_values(_attrs)
+        return [{name: row[name] for name in names} for row in rows]
 
     def values_list(self, *attrs: str, **kwargs) -> List[Tuple[Any, ...]]:
         """
@@ -602,6 +1045,11 @@ class F:
             >>> Entry.objects.values_list('uid', named=True)
             [Row(uid='barney'), Row(uid='fred'), ...]
 
+        As with :py:meth:`values`, you may also ask for ``dn``:
+
+            >>> Entry.objects.values_list('dn', 'cn')
+            [('uid=barney,ou=people,o=example', 'Barney Rubble'), ...]
+
         Note:
             We're trying to model how the Django ORM works here, so :py:meth:`values_list`
             is not compatible with :py:meth:`.only()`.  If previously in your filter
@@ -622,24 +1070,73 @@ class F:
             _attrs = self.attributes
             attrs = tuple(self.attribute_to_field_name_map[attr] for attr in _attrs)
         else:
-            _attrs = [self.get_attribute(attr) for attr in attrs]
-        objects = self.model.from_db(_attrs, self.manager.search(str(self), _attrs), many=True)
-        objects = self.__sort(cast(Sequence["Model"], objects))
+            _attrs = [self.get_attribute(attr) for attr in attrs if attr != 'dn']
+        rows = self.__search_values(_attrs)
         if 'flat' in kwargs and kwargs['flat']:
             if len(attrs) > 1:
                 raise ValueError("Cannot use flat=True when asking for more than one field")
-            return [getattr(obj, attrs[0]) for obj in objects]
+            return [row[attrs[0]] for row in rows]
         if 'named' in kwargs and kwargs['named']:
-            rows: List[Any] = []
-            for obj in objects:
-                Row = namedtuple('Row', attrs)  # type: ignore
-                # the keys here should be field names, not attribute names
-                rows.append(Row(**{attr: getattr(obj, attr) for attr in attrs}))
-            return rows
-        data: List[Tuple[str, ...]] = []
-        for obj in objects:
-            data.append(tuple(getattr(obj, attr) for attr in attrs))
-        return data
+            # the keys here should be field names, not attribute names
+            Row = namedtuple('Row', attrs)  # type: ignore
+            return [Row(*(row[attr] for attr in attrs)) for row in rows]
+        return [tuple(row[attr] for attr in attrs) for row in rows]
+
+    def _fetch_all(self) -> List["Model"]:
+        if self._result_cache is None:
+            self._result_cache = list(self.all())
+        return self._result_cache
+
+    def __iter__(self) -> Iterator["Model"]:
+        """
+        Iterate over the objects that match our filters.
+
+        As with a Django ``QuerySet``, the LDAP search is done the first time
+        we're iterated over and the results are cached, so iterating again,
+        or asking for our ``len()``, does not do another search.  Use
+        :py:meth:`all` if you want to force a fresh search.
+        """
+        return iter(self._fetch_all())
+
+    def __len__(self) -> int:
+        return len(self._fetch_all())
+
+    def __bool__(self) -> bool:
+        return bool(self._fetch_all())
+
+    def __getitem__(self, k: Union[int, slice]) -> Union["Model", Sequence["Model"]]:
+        """
+        Return an object or a slice of our objects, as with a Django
+        ``QuerySet``.  This is what lets a Django ``Paginator`` work with us.
+
+        If we haven't already done our search and have no ``order_by``, we ask
+        the LDAP server for only as many objects as we need to reach the end of
+        the slice (e.g. 50 objects for ``[25:50]``), since LDAP's own ordering
+        is as good as any.  LDAP has no way to skip entries, so we still get
+        the ones before the start of the slice.  Otherwise we do the full
+        search and slice the sorted results.
+
+        If the LDAP server's own size limit stops it short of the objects we
+        asked for, we fall back to the full search.
+        """
+        if self._result_cache is None and not self._order_by:
+            try:
+                if (
+                    isinstance(k, slice) and
+                    (k.start or 0) >= 0 and
+                    k.step is None and
+                    k.stop is not None and
+                    k.stop > (k.start or 0)
+                ):
+                    return list(self.all(sizelimit=k.stop))[k.start:k.stop]
+                if isinstance(k, int) and k >= 0:
+                    objects = self.all(sizelimit=k + 1)
+                    if len(objects) <= k:
+                        raise IndexError('F index out of range')
+                    return objects[k]
+            except ldap.SIZELIMIT_EXCEEDED:    # pylint:disable=no-member
+                pass
+        return self._fetch_all()[k]
 
     def __or__(self, other: "F") -> "F":
         self.chain = Filter.OR([self._filter, other._filter])
@@ -680,6 +1177,20 @@ class LdapManager:
         # keys in this dictionary get manipulated by .connect() and
         # .disconnect()
         self._ldap_objects: Dict[threading.Thread, ldap.ldapobject.LDAPObject] = {}
+        # The pools that the connections in self._ldap_objects came from, if
+        # any, along with the exact connection each pool handed us
+        self._ldap_pools: Dict[
+            threading.Thread,
+            Tuple[LdapConnectionPool, ldap.ldapobject.LDAPObject]
+        ] = {}
+        # The config key ("read" or "write") each connection in
+        # self._ldap_objects was bound with
+        self._ldap_keys: Dict[threading.Thread, str] = {}
+        # Modlist keeps no state between calls, so we only need the one
+        self._modlist_builder = Modlist(self)
+        # The LDAP attribute we use for the RDN of our objects' dns.  This is
+        # set the first time we need it by __get_dn_key()
+        self._dn_key: Optional[str] = None
 
     def _get_pctrls(self, serverctrls):
         """
@@ -703,15 +1214,46 @@ class LdapManager:
         Performs a pages search against the LDAP server. Code lifted from:
         https://gist.github.com/mattfahrner/c228ead9c516fc322d3a
         """
+        results: List[LDAPData] = []
+        for page in self._iter_paged_search(
+            basedn,
+            searchfilter,
+            attrlist=attrlist,
+            pagesize=pagesize,
+            sizelimit=sizelimit,
+            scope=scope
+        ):
+            results.extend(page)
+        return results
+
+    def _iter_paged_search(
+        self,
+        basedn: str,
+        searchfilter: str,
+        attrlist: List[str] = None,
+        pagesize: int = 100,
+        sizelimit: int = 0,
+        scope: int = ldap.SCOPE_SUBTREE,
+        ldap_object: ldap.ldapobject.LDAPObject = None
+    ) -> Iterator[List[LDAPData]]:
+        """
+        Do a paged search against the LDAP server, yielding each page of
+        results as we get it, so that we don't request the next page until our
+        caller is done with the one it has.
+
+        If ``ldap_object`` is given, search with that connection instead of our
+        per-thread connection.
+        """
+        if ldap_object is None:
+            ldap_object = self.connection
         # Initialize the LDAP controls for paging. Note that we pass ''
         # for the cookie because on first iteration, it starts out empty.
         controls = SimplePagedResultsControl(True, size=pagesize, cookie='')
 
         # Do searches until we run out of pages to get from the LDAP server.
-        results: List[LDAPData] = []
         while True:
             # Send search request.
-            msgid = self.connection.search_ext(
+            msgid = ldap_object.search_ext(
                 basedn,
                 scope,
                 searchfilter,
@@ -719,16 +1261,15 @@ class LdapManager:
                 serverctrls=[controls],
                 sizelimit=sizelimit
             )
-            rtype, rdata, rmsgid, serverctrls = self.connection.result3(msgid)  # pylint: disable=unused-variable
+            rtype, rdata, rmsgid, serverctrls = ldap_object.result3(msgid)  # pylint: disable=unused-variable
             # Each "rdata" is a tuple of the form (dn, attrs), where dn is
             # a string containing the DN (distinguished name) of the entry,
             # and attrs is a dictionary containing the attributes associated
             # with the entry. The keys of attrs are strings, and the associated
             # values are lists of strings.
-            for dn, attrs in rdata:
-                # AD returns an rdata at the end that is a reference that we want to ignore
-                if isinstance(attrs, dict):
-                    results.append((dn, attrs))
+            #
+            # AD returns an rdata at the end that is a reference that we want to ignore
+            yield [(dn, attrs) for dn, attrs in rdata if isinstance(attrs, dict)]
 
             # Get cookie for the next request.
             paged_controls = self._get_pctrls(serverctrls)
@@ -742,6 +1283,56 @@ class LdapManager:
             # If there is no cookie, we're done!
             if not paged_controls[0].cookie:
                 break
+
+    def _sizelimited_search(
+        self,
+        basedn: str,
+        searchfilter: str,
+        attrlist: List[str] = None,
+        sizelimit: int = 0,
+        scope: int = ldap.SCOPE_SUBTREE,
+        sort_keys: List[str] = None
+    ) -> List[LDAPData]:
+        """
+        Perform a search which returns at most ``sizelimit`` entries.
+
+        If more than ``sizelimit`` entries match, the server sends us the first
+        ``sizelimit`` of them and then reports a size limit exceeded error.  We
+        read the entries one at a time so that we keep the ones we got before
+        that error arrives.
+
+        If ``sort_keys`` is given, ask the server to sort the entries by those
+        attributes before applying ``sizelimit``.
+
+        Raises:
+            ldap.SIZELIMIT_EXCEEDED: the server stopped before we got
+                ``sizelimit`` entries, so it was the server's own size limit
+                that we hit, not ours.
+        """
+        serverctrls = None
+        if sort_keys:
+            serverctrls = [SSSRequestControl(criticality=True, ordering_rules=sort_keys)]
+        msgid = self.connection.search_ext(
+            basedn,
+            scope,
+            searchfilter,
+            attrlist,
+            serverctrls=serverctrls,
+            sizelimit=sizelimit
+        )
+        results: List[LDAPData] = []
+        try:
+            while True:
+                rtype, rdata = self.connection.result(msgid, all=0)
+                for dn, attrs in rdata:
+                    # AD returns references that we want to ignore
+                    if isinstance(attrs, dict):
+                        results.append((dn, attrs))
+                if rtype == ldap.RES_SEARCH_RESULT:
+                    break
+        except ldap.SIZELIMIT_EXCEEDED:    # pylint:disable=no-member
+            if not sizelimit or len(results) < sizelimit:
+                raise
         return results
 
     def contribute_to_class(self, cls, accessor_name):
@@ -777,13 +1368,15 @@ class LdapManager:
         setattr(cls, accessor_name, self)
 
     def __get_dn_key(self, meta: "Options") -> str:
-        _attribute_lookup = meta.attribute_to_field_name_map
-        dn_key = self.pk
-        for k, v in _attribute_lookup.items():
-            if v == self.pk:
-                dn_key = k
-                break
-        return dn_key
+        if self._dn_key is None:
+            _attribute_lookup = meta.attribute_to_field_name_map
+            dn_key = self.pk
+            for k, v in _attribute_lookup.items():
+                if v == self.pk:
+                    dn_key = k
+                    break
+            self._dn_key = dn_key
+        return cast(str, self._dn_key)
 
     def dn(self, obj: "Model") -> Optional[str]:
         if not obj._dn:
@@ -812,8 +1405,25 @@ class LdapManager:
         dn_key = self.__get_dn_key(meta)
         return "{}={},{}".format(dn_key, pk, self.basedn)
 
-    def disconnect(self) -> None:
-        self.connection.unbind_s()
+    def disconnect(self, discard: bool = False) -> None:
+        """
+        Unbind our per-thread connection object, or give it back to its
+        connection pool if it came from one.
+
+        Keyword Args:
+            discard: if ``True``, don't return the connection to its pool
+        """
+        pooled = self._ldap_pools.pop(threading.current_thread(), None)
+        if pooled is None:
+            self.connection.unbind_s()
+        else:
+            # Give back the connection the pool handed us, even if someone
+            # has since swapped our per-thread connection with .set_connection()
+            pool, ldap_object = pooled
+            if discard:
+                pool.discard(ldap_object)
+            else:
+                pool.release(ldap_object)
         self.remove_connection()
 
     def has_connection(self) -> bool:
@@ -821,9 +1431,26 @@ class LdapManager:
 
     def set_connection(self, obj: ldap.ldapobject.LDAPObject) -> None:
         self._ldap_objects[threading.current_thread()] = obj
+        # We don't know what obj is bound to, so forget what the connection
+        # it replaces was bound to
+        self._ldap_keys.pop(threading.current_thread(), None)
 
     def remove_connection(self) -> None:
         del self._ldap_objects[threading.current_thread()]
+        self._ldap_keys.pop(threading.current_thread(), None)
+
+    def _has_connection_for(self, key: str) -> bool:
+        """
+        Return ``True`` if we have a per-thread connection we can use for
+        ``key`` operations.  A connection to our read-write server will do for
+        reads, but one to our read-only server won't do for writes.
+        """
+        thread = threading.current_thread()
+        if thread not in self._ldap_objects:
+            return False
+        # We don't know what a connection from .set_connection() is bound to,
+        # so we trust the caller with it
+        return key == 'read' or self._ldap_keys.get(thread, key) == key
 
     def _connect(
         self,
@@ -844,6 +1471,24 @@ class LdapManager:
         ldap_object.simple_bind_s(dn, password)
         return ldap_object
 
+    def _get_pool(self, key: str) -> Optional[LdapConnectionPool]:
+        """
+        Return the connection pool for the ``key`` section of our config, or
+        ``None`` if that section has no ``pool_size`` setting.
+        """
+        config = cast(Dict[str, Any], self.config)[key]
+        if not config.get('pool_size'):
+            return None
+        pool_key = (config['url'], config['user'])
+        with _pools_lock:
+            if pool_key not in _pools:
+                _pools[pool_key] = LdapConnectionPool(
+                    lambda: self._connect(key),
+                    size=config['pool_size'],
+                    idle_check=config.get('pool_idle_check', 30.0)
+                )
+            return _pools[pool_key]
+
     def connect(
         self,
         key: str,
@@ -865,8 +1510,27 @@ class LdapManager:
             password: If provided, use this as our password instead of the
                 password in our ``self.settings`` configuration object.
 
+        If ``dn`` is not given and our ``self.settings`` configuration for
+        ``key`` has a ``pool_size``, the connection comes from a
+        :py:class:`LdapConnectionPool` instead of being made from scratch.
+
+        Raises:
+            RuntimeError: this thread already has a connection; use
+                :py:meth:`new_connection` if you need a second one.
         """
-        self._ldap_objects[threading.current_thread()] = self._connect(key, dn=dn, password=password)
+        thread = threading.current_thread()
+        if thread in self._ldap_objects:
+            raise RuntimeError(
+                '{} already has an LDAP connection in this thread'.format(self.__class__.__name__)
+            )
+        pool = None if dn else self._get_pool(key)
+        if pool is None:
+            self._ldap_objects[thread] = self._connect(key, dn=dn, password=password)
+        else:
+            ldap_object = pool.acquire()
+            self._ldap_objects[thread] = ldap_object
+            self._ldap_pools[thread] = (pool, ldap_object)
+        self._ldap_keys[thread] = key
 
     def new_connection(
         self,
@@ -875,8 +1539,9 @@ class LdapManager:
         password: str = None
     ) -> ldap.ldapobject.LDAPObject:
         """
-        This is used internally to set our per-thread connection object.  It is primarily used by
-        the ``@atomic`` decorator.
+        Make and bind a brand new connection to an LDAP server.  This is never
+        our per-thread connection and never comes from a connection pool, so
+        the caller is responsible for unbinding it.
 
         Keyword Args:
             key: A key into our ``self.settings`` configuration object.  This
@@ -896,6 +1561,87 @@ class LdapManager:
     def connection(self) -> ldap.ldapobject.LDAPObject:
         return self._ldap_objects[threading.current_thread()]
 
+    @contextmanager
+    def connection_scope(self, key: str = 'read') -> Iterator[ldap.ldapobject.LDAPObject]:
+        """
+        Bind a single connection to an LDAP server and use it for every LDAP
+        operation this manager does in this thread until the ``with`` block
+        exits.  Without this, each operation opens, binds and unbinds its own
+        connection.
+
+        Example:
+
+            >>> with LDAPUser.objects.connection_scope('write'):
+            ...     user = LDAPUser.objects.get(uid='fred')
+            ...     user.mail = ['fred@example.com']
+            ...     user.save()
+
+        If we already have a connection in this thread that will do for
+        ``key``, we just use that one.  If we're asked to write while we only
+        have a connection to our read-only server, we set that connection
+        aside, bind a separate one to our read-write server for the block, and
+        restore the read-only one afterwards.
+
+        Args:
+            key: either "read" or "write"; see :py:func:`atomic`.  Use "write"
+                if you'll be doing any writes within the block.
+        """
+        if self._has_connection_for(key):
+            yield self.connection
+            return
+        thread = threading.current_thread()
+        held = None
+        if self.has_connection():
+            held = (
+                self._ldap_objects.pop(thread),
+                self._ldap_pools.pop(thread, None),
+                self._ldap_keys.pop(thread, None),
+            )
+        try:
+            self.connect(key)
+            discard = False
+            try:
+                yield self.connection
+            except CONNECTION_ERRORS:
+                # Don't give a broken connection back to its pool.  Other
+                # errors, like NO_SUCH_OBJECT, leave the connection usable.
+                discard = True
+                raise
+            finally:
+                self.disconnect(discard=discard)
+        finally:
+            if held is not None:
+                ldap_object, pooled, held_key = held
+                self._ldap_objects[thread] = ldap_object
+                if pooled is not None:
+                    self._ldap_pools[thread] = pooled
+                if held_key is not None:
+                    self._ldap_keys[thread] = held_key
+
+    @contextmanager
+    def _own_connection(self, key: str) -> Iterator[ldap.ldapobject.LDAPObject]:
+        """
+        Check a connection out of our ``key`` connection pool, or make a new
+        one if we have no pool, for use only within the ``with`` block.  This
+        is never our per-thread connection, so nothing else can use it or
+        unbind it out from under us.
+        """
+        pool = self._get_pool(key)
+        ldap_object = self._connect(key) if pool is None else pool.acquire()
+        discard = False
+        try:
+            yield ldap_object
+        except CONNECTION_ERRORS:
+            discard = True
+            raise
+        finally:
+            if pool is None:
+                ldap_object.unbind_s()
+            elif discard:
+                pool.discard(ldap_object)
+            else:
+                pool.release(ldap_object)
+
     def _get_ssha_hash(self, password: str) -> bytes:
         salt = os.urandom(8)
         h = hashlib.sha1(password.encode('utf-8'))
@@ -910,10 +1656,39 @@ class LdapManager:
         attributes: List[str],
         sizelimit: int = 0,
         basedn: str = None,
-        scope: int = ldap.SCOPE_SUBTREE
+        scope: int = ldap.SCOPE_SUBTREE,
+        sort_keys: List[str] = None
     ) -> List[LDAPData]:
         if basedn is None:
             basedn = self.basedn
+        if sizelimit or sort_keys:
+            # We only want a few entries, so there's no need to page
+            try:
+                return self._sizelimited_search(
+                    basedn,
+                    searchfilter,
+                    attrlist=attributes,
+                    sizelimit=sizelimit,
+                    scope=scope,
+                    sort_keys=sort_keys
+                )
+            except ldap.SIZELIMIT_EXCEEDED:    # pylint:disable=no-member
+                # The server's own size limit is lower than ours.  Paging gets
+                # around that, but we can't have the server sort the pages.
+                if sort_keys or 'paged_search' not in self.ldap_options:
+                    raise
+            results: List[LDAPData] = []
+            for page in self._iter_paged_search(
+                basedn,
+                searchfilter,
+                attrlist=attributes,
+                pagesize=min(sizelimit, self.pagesize),
+                scope=scope
+            ):
+                results.extend(page)
+                if len(results) >= sizelimit:
+                    break
+            return results[:sizelimit]
         if 'paged_search' in self.ldap_options:
             return self._paged_search(
                 basedn,
@@ -935,6 +1710,56 @@ class LdapManager:
                 objects.append(obj)
         return objects
 
+    def search_iter(
+        self,
+        searchfilter: str,
+        attributes: List[str],
+        basedn: str = None,
+        scope: int = ldap.SCOPE_SUBTREE,
+        pagesize: int = None
+    ) -> Iterator[LDAPData]:
+        """
+        Like :py:meth:`search`, but yield the matching entries as we get them
+        instead of returning them all at once.  If our model has
+        ``'paged_search'`` in ``Meta.ldap_options``, we only ask the server for
+        the next page of results once the entries in the previous page have
+        been consumed, so we only ever hold one page in memory.  Otherwise we
+        get all the entries from the server up front.
+
+        Each iteration holds a connection to our read-only server of its own
+        (from our connection pool, if we have one) until it finishes or the
+        generator is closed.  It never uses our per-thread connection, so you
+        can interleave several iterations, and do other operations (including
+        writes) while iterating.
+
+        Args:
+            searchfilter: the LDAP search filter
+            attributes: the LDAP attributes to return for each entry
+
+        Keyword Args:
+            basedn: search under this dn instead of our model's basedn
+            scope: the LDAP search scope
+            pagesize: the number of entries per page, instead of
+                ``self.pagesize``
+        """
+        if basedn is None:
+            basedn = self.basedn
+        with self._own_connection('read') as ldap_object:
+            if 'paged_search' not in self.ldap_options:
+                data = ldap_object.search_s(basedn, scope, filterstr=searchfilter, attrlist=attributes)
+                # We have to filter out any references that AD puts in
+                yield from (obj for obj in data if isinstance(obj[1], dict))
+                return
+            for page in self._iter_paged_search(
+                basedn,
+                searchfilter,
+                attrlist=attributes,
+                pagesize=pagesize or self.pagesize,
+                scope=scope,
+                ldap_object=ldap_object
+            ):
+                yield from page
+
     @atomic(key='write')
     def add(self, obj: "Model") -> None:
         # This is a bit weird here because the objectclass CharListField gets
@@ -943,7 +1768,7 @@ class LdapManager:
         for objectclass in self.extra_objectclasses:
             obj.objectclass.append(objectclass.encode())  # type: ignore
         obj.objectclass.append(self.objectclass.encode())  # type: ignore
-        _modlist = Modlist(self).add(obj)
+        _modlist = self._modlist_builder.add(obj)
         self.connection.add_s(self.dn(obj), _modlist)
 
     @atomic(key='write')
@@ -959,8 +1784,36 @@ class LdapManager:
             The filters you pass should uniquely identify a single LDAP object.
 
             We do this to protect LDAP itself from our bugs.
+
+        If the only filter is on our primary key, we first try deleting the
+        object at the dn it would have directly under our basedn, with an LDAP
+        assertion control (RFC 4528) so that the server only deletes it if it
+        matches the same search filter we would have used to find it.  If
+        there is no such object there, we search for it as usual.
+
+        Raises:
+            self.model.DoesNotExist: no object matched the filters
         """
-        obj = self.filter(*args, **kwargs).only(self.pk).get()
+        pk = cast(str, self.pk)
+        f = self.filter(*args, **kwargs)
+        if not args and list(kwargs) == [pk] and isinstance(kwargs[pk], str):
+            assertion = AssertionControl(criticality=True, filterstr=str(f))
+            try:
+                self.connection.delete_ext_s(
+                    self.get_dn(escape_dn_chars(kwargs[pk])),
+                    serverctrls=[assertion]
+                )
+                return
+            except (
+                ldap.NO_SUCH_OBJECT,                 # pylint:disable=no-member
+                ldap.ASSERTION_FAILED,               # pylint:disable=no-member
+                ldap.UNAVAILABLE_CRITICAL_EXTENSION  # pylint:disable=no-member
+            ):
+                # Either there's no object at that dn (it may be in an OU below
+                # our basedn), the object there isn't one of ours, or the
+                # server doesn't do assertions
+                pass
+        obj = f.only(pk).get()
         self.connection.delete_s(obj.dn)
 
     @atomic(key='write')
@@ -976,9 +1829,8 @@ class LdapManager:
         """
         Update an object's dn, keeping it within the same basedn.
         """
-        newrdn = new_dn.split(',')[0]
-        old_basedn = ','.join(old_dn.split(',')[1:])
-        new_basedn = ','.join(new_dn.split(',')[1:])
+        old_basedn = old_dn.partition(',')[2]
+        newrdn, _, new_basedn = new_dn.partition(',')
         newsuperior = None
         if old_basedn != new_basedn:
             newsuperior = new_basedn
@@ -989,13 +1841,13 @@ class LdapManager:
         # First check to see whether we updated our primary key.  If so, we need to rename
         # the object in LDAP, and its obj._dn.  The old obj._dn should reference the old PK.
         # We'll .lower() them to deal with case for the pk in the dn
-        old_pk_value = cast(str, obj.dn).split(',')[0].split('=')[1].lower()
+        old_rdn, _, basedn = cast(str, obj.dn).partition(',')
+        old_pk_value = old_rdn.partition('=')[2].lower()
         new_pk_value = getattr(obj, cast(str, self.pk)).lower()
         if new_pk_value != old_pk_value:
             # We need to do a modrdn_s if we change pk, to cause the dn to be updated also
             self.connection.modrdn_s(obj.dn, f'{self.pk}={new_pk_value}')
             # And update our object's _dn to the new one
-            basedn = ','.join(cast(str, obj.dn).split(',')[1:])
             new_dn = f'{self.pk}={new_pk_value},{basedn}'
             obj._dn = new_dn
             # force reload old, if it was passed in so that we get the new pk value and dn
@@ -1005,15 +1857,118 @@ class LdapManager:
         if not old:
             pk_val = cast(str, self.pk)
             old = self.get_by_dn(obj._dn)
-        _modlist = Modlist(self).update(obj, cast("Model", old))
+        _modlist = self._modlist_builder.update(obj, cast("Model", old))
         if _modlist:
             # Only issue the modify_s if we actually have changes
             self.connection.modify_s(obj.dn, _modlist)
         else:
             self.logger.debug('ldaporm.manager.modify.no-changes dn=%s', obj.dn)
 
+    @atomic(key='write')
+    def add_values(self, obj: Union["Model", str], field_name: str, values: Sequence[Any]) -> None:
+        """
+        Add ``values`` to the multi-valued field ``field_name`` on ``obj`` with a
+        single ldap.MOD_ADD of just those values, rather than appending them
+        to the field one at a time and having ``obj.save()`` re-send every
+        value of the attribute.
+
+        Values that are repeated in ``values`` or that ``obj`` already has are
+        skipped, since LDAP refuses to add a value an attribute already has.
+        We also add the new values to the field on ``obj`` itself.
+
+        ``obj`` may also be the dn of the object to modify, in which case we
+        don't need to have fetched the object first.
+
+        Adding a value that the attribute already has in LDAP is not an error:
+        if LDAP refuses the modify for that reason, we add the values one at a
+        time and skip the ones that are already there.
+
+        Example:
+
+            >>> LDAPGroup.objects.add_values(group, 'member_uids', ['fred', 'barney'])
+            >>> LDAPGroup.objects.add_values(group_dn, 'member_uids', ['fred'])
+
+        Args:
+            obj: the object to modify, or its dn
+            field_name: the name of a multi-valued field on our model
+            values: the values to add
+        """
+        if isinstance(obj, str):
+            dn = obj
+            current: List[Any] = []
+        else:
+            dn = cast(str, obj.dn)
+            current = getattr(obj, field_name) or []
+        existing = set(current)
+        new_values = [v for v in dict.fromkeys(values) if v not in existing]
+        if not new_values:
+            return
+        field = cast("Options", cast(Type["Model"], self.model)._meta).get_field(field_name)
+        data = field.to_db_value(new_values)[field.ldap_attribute]
+        try:
+            self.connection.modify_s(dn, [(ldap.MOD_ADD, field.ldap_attribute, data)])
+        except ldap.TYPE_OR_VALUE_EXISTS:  # pylint:disable=no-member
+            # LDAP rejects the whole modify if any one value already exists
+            for value in data:
+                try:
+                    self.connection.modify_s(dn, [(ldap.MOD_ADD, field.ldap_attribute, [value])])
+                except ldap.TYPE_OR_VALUE_EXISTS:  # pylint:disable=no-member
+                    pass
+        if not isinstance(obj, str):
+            setattr(obj, field_name, list(current) + new_values)
+
+    @atomic(key='write')
+    def remove_values(self, obj: Union["Model", str], field_name: str, values: Sequence[Any]) -> None:
+        """
+        Remove ``values`` from the multi-valued field ``field_name`` on ``obj``
+        with a single ldap.MOD_DELETE of just those values.  Unlike changing
+        the field and calling ``obj.save()``, this doesn't re-read ``obj`` from
+        LDAP or re-send the values that remain, so its cost does not depend on
+        how many values the attribute has.
+
+        We also remove ``values`` from the field on ``obj`` itself.
+
+        ``obj`` may also be the dn of the object to modify, in which case we
+        don't need to have fetched the object first.
+
+        Removing a value that the attribute doesn't have in LDAP is not an
+        error: if LDAP refuses the modify for that reason, we remove the values
+        one at a time and skip the ones that aren't there.
+
+        Example:
+
+            >>> LDAPGroup.objects.remove_values(group, 'member_uids', ['fred'])
+            >>> LDAPGroup.objects.remove_values(group_dn, 'member_uids', ['fred'])
+
+        Args:
+            obj: the object to modify, or its dn
+            field_name: the name of a multi-valued field on our model
+            values: the values to remove
+        """
+        if not values:
+            # A MOD_DELETE with no values would delete the whole attribute
+            return
+        dn = obj if isinstance(obj, str) else cast(str, obj.dn)
+        field = cast("Options", cast(Type["Model"], self.model)._meta).get_field(field_name)
+        data = field.to_db_value(list(dict.fromkeys(values)))[field.ldap_attribute]
+        try:
+            self.connection.modify_s(dn, [(ldap.MOD_DELETE, field.ldap_attribute, data)])
+        except ldap.NO_SUCH_ATTRIBUTE:  # pylint:disable=no-member
+            # LDAP rejects the whole modify if any one value is missing
+            for value in data:
+                try:
+                    self.connection.modify_s(dn, [(ldap.MOD_DELETE, field.ldap_attribute, [value])])
+                except ldap.NO_SUCH_ATTRIBUTE:  # pylint:disable=no-member
+                    pass
+        if isinstance(obj, str):
+            return
+        current = getattr(obj, field_name)
+        if isinstance(current, list):
+            removed = set(values)
+            setattr(obj, field_name, [v for v in current if v not in removed])
+
     def only(self, *names: str) -> "F":
-        return F(self).only(*names)
+        return self.__filter().only(*names)
 
     def __filter(self) -> "F":
         f = F(self)
@@ -1029,6 +1984,10 @@ class LdapManager:
     def filter(self, *args, **kwargs) -> "F":
         return self.__filter().filter(*args, **kwargs)
 
+    @substitute_pk
+    def exclude(self, *args, **kwargs) -> "F":
+        return self.__filter().exclude(*args, **kwargs)
+
     def get_by_dn(self, dn: str) -> "Model":
         """
         Get an object specifically by its DN.  To do this we do a search with
@@ -1073,6 +2032,24 @@ class LdapManager:
     def get(self, *args, **kwargs) -> "Model":
         return self.__filter().filter(*args, **kwargs).get()
 
+    @substitute_pk
+    def exists(self, *args, **kwargs) -> bool:
+        """
+        Return ``True`` if any object matches the given filters.  This takes
+        the same arguments as :py:meth:`F.filter`.  Use this instead of
+        :py:meth:`get` when you just need to know whether an object is there:
+        it asks the LDAP server for at most one entry and no attributes.
+
+        Example:
+
+            >>> LDAPUser.objects.exists(uid='fred')
+            True
+        """
+        f = self.__filter()
+        if args or kwargs:
+            f = f.filter(*args, **kwargs)
+        return f.exists()
+
     def all(self) -> Sequence["Model"]:
         """
         .. note::
@@ -1083,6 +2060,20 @@ class LdapManager:
         """
         return self.__filter().all()
 
+    def iterator(self, chunk_size: int = 100) -> Iterator["Model"]:
+        return self.__filter().iterator(chunk_size=chunk_size)
+
+    def count(self) -> int:
+        return self.__filter().count()
+
+    def in_bulk(
+        self,
+        id_list: Sequence[Any],
+        field_name: str = 'pk',
+        batch_size: Optional[int] = None
+    ) -> Dict[Any, "Model"]:
+        return self.__filter().in_bulk(id_list, field_name=field_name, batch_size=batch_size)
+
     def values(self, *args: str) -> List[Dict[str, Any]]:
         return self.__filter().values(*args)
 
@@ -1109,11 +2100,15 @@ class LdapManager:
         attr = {password_attribute: [pwhash]}
         cast(Dict[str, Any], attributes).update(attr)
 
-        _modlist = Modlist(self)._get_modlist(attr, ldap.MOD_REPLACE)
+        _modlist = self._modlist_builder._get_modlist(attr, ldap.MOD_REPLACE)
 
-        self.connect('write')
-        self.connection.modify_s(user.dn, _modlist)
-        self.disconnect()
+        # Use a connection of our own so that we neither replace nor write
+        # over any per-thread connection our caller may be holding
+        ldap_object = self.new_connection('write')
+        try:
+            ldap_object.modify_s(user.dn, _modlist)
+        finally:
+            ldap_object.unbind_s()
         service = getattr(model._meta, 'ldap_server', 'ldap')
         self.logger.info('%s.password_reset.success dn=%s', service, user.dn)
         return True
@@ -1122,6 +2117,7 @@ class LdapManager:
         """
         Try to authenticate a username/password vs our LDAP server.
 
+        If the password is empty, return False without talking to LDAP.
         If the user does not exist in LDAP, return False.
         If the user exists, but the bind fails, return False.
         Else, return True.
@@ -1137,6 +2133,12 @@ class LdapManager:
 
         :rtype: boolean
         """
+        if not password:
+            # An LDAP simple bind with an empty password is an unauthenticated
+            # bind, which servers allow, so never try one.  This also saves us
+            # looking up the user.
+            self.logger.warning('auth.empty_password user=%s', username)
+            return False
         model = cast(Type["Model"], self.model)
         uid_attr = cast("Options", model._meta).userid_attribute
         try:
@@ -1144,18 +2146,26 @@ class LdapManager:
         except model.DoesNotExist:
             self.logger.warning('auth.no_such_user user=%s', username)
             return False
+        # Bind as the user on a connection of our own: it must never become
+        # our per-thread connection, or end up in a connection pool
         try:
-            self.connect('read', user.dn, password)
-        except ldap.INVALID_CREDENTIALS:
+            ldap_object = self.new_connection('read', user.dn, password)
+        except ldap.INVALID_CREDENTIALS:    # pylint:disable=no-member
             self.logger.warning('auth.invalid_credentials user=%s', username)
             return False
-        self.disconnect()
+        ldap_object.unbind_s()
         self.logger.info('auth.success user=%s', username)
         return True
 
+    @atomic(key='write')
     def create(self, **kwargs) -> "Model":
         """
         Create a model object based on **kwargs, then LDAP_ADD it to LDAP.
+
+        The add and the subsequent re-read of the new object share a single
+        connection to our read-write server, so we only pay for one bind, and
+        the re-read can't miss the new object due to replication lag on the
+        read-only server.
         """
         obj = cast(Type["Model"], self.model)(**kwargs)
         self.add(obj)
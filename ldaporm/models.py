@@ -2,7 +2,7 @@ from base64 import b64encode as encode
 import hashlib
 import inspect
 import os
-from typing import Any, Dict, List, Optional, Sequence, Union, cast
+from typing import Any, ClassVar, Dict, List, Optional, Sequence, Tuple, Union, cast
 
 from django.core.exceptions import ValidationError, FieldDoesNotExist
 try:
@@ -95,7 +95,8 @@ class Model(metaclass=LdapModelBase):
         pass
 
     _meta: Optional[Options] = None
-    objects: Optional[LdapManager] = None
+    # LdapModelBase sets this on every subclass
+    objects: ClassVar[LdapManager] = None  # type: ignore
 
     def __init__(self, *args, **kwargs) -> None:
         cls = self.__class__
@@ -166,6 +167,27 @@ class Model(metaclass=LdapModelBase):
             raise RuntimeError('Called {}.from_db() with many=False but len(objects) > 1'.format(
                 cast(Options, cls._meta).object_name)
             )
+        rows = [cls(_dn=dn, **kwargs) for dn, kwargs in cls.values_from_db(attributes, objects)]
+        if not many:
+            return rows[0]
+        return rows
+
+    @classmethod
+    def values_from_db(
+        cls,
+        attributes: List[str],
+        objects: Sequence[LDAPData]
+    ) -> List[Tuple[str, Dict[str, Any]]]:
+        """
+        Convert the raw LDAP data objects in ``objects`` into ``(dn, values)``
+        tuples, where ``values`` maps field names to the values for the LDAP
+        ``attributes`` we asked for, converted to their Python types.  Fields
+        whose attribute is missing from an object are left out of its
+        ``values``.
+
+        This is what :py:meth:`from_db` uses to build model instances; use it
+        directly when you just want the values.
+        """
         _attr_lookup = cast(Options, cls._meta).attribute_to_field_name_map
         _field_lookup = cast(Options, cls._meta).fields_map
         for attr in attributes:
@@ -175,32 +197,44 @@ class Model(metaclass=LdapModelBase):
                         cast(Options, cls._meta).object_name, attr
                     )
                 )
+        # Work out the field name and converter for each attribute once, rather than once per object
+        specs = [
+            (attr, attr.lower(), _attr_lookup[attr], _field_lookup[_attr_lookup[attr]].from_db_value)
+            for attr in attributes
+        ]
         rows = []
         for obj in objects:
             if not isinstance(obj[1], dict):
                 continue
-            # Case sensitivity does not matter in LDAP, but it does when we're looking up keys in our dict here.  Deal
-            # with the case for when we have a different case on our field name than what LDAP returns
-            obj_attr_lookup = {k.lower(): k for k in obj[1]}
-            kwargs = {}
-            kwargs['_dn'] = obj[0]
-            for attr in attributes:
-                name = _attr_lookup[attr]
-                try:
-                    value: Any = obj[1][obj_attr_lookup[attr.lower()]]
-                except KeyError:
-                    # if the object in LDAP doesn't have that data, the
-                    # attribute won't be present in the response
-                    continue
-                kwargs[name] = _field_lookup[name].from_db_value(value)
-            rows.append(cls(**kwargs))
-        if not many:
-            return rows[0]
+            entry = obj[1]
+            obj_attr_lookup: Optional[Dict[str, str]] = None
+            values = {}
+            for attr, lower_attr, name, from_db_value in specs:
+                if attr in entry:
+                    # LDAP servers usually return attribute names in the case we asked for them
+                    value: Any = entry[attr]
+                else:
+                    # Case sensitivity does not matter in LDAP, but it does when we're looking up keys in our dict
+                    # here.  Deal with the case for when we have a different case on our field name than what LDAP
+                    # returns
+                    if obj_attr_lookup is None:
+                        obj_attr_lookup = {k.lower(): k for k in entry}
+                    try:
+                        value = entry[obj_attr_lookup[lower_attr]]
+                    except KeyError:
+                        # if the object in LDAP doesn't have that data, the
+                        # attribute won't be present in the response
+                        continue
+                values[name] = from_db_value(value)
+            rows.append((obj[0], values))
         return rows
 
     @classmethod
     def _default_manager(cls) -> "LdapManager":
-        return cast("LdapManager", cls.objects)
+        """
+        Return our manager.
+        """
+        return cls.objects
 
     @classmethod
     def get_password_hash(cls, password: str) -> bytes:
@@ -269,24 +303,23 @@ class Model(metaclass=LdapModelBase):
     def dn(self) -> Optional[str]:
         if self._dn:
             return self._dn
-        _meta = cast(Options, self._meta)
-        manager = cast(LdapManager, _meta.base_manager)
-        return manager.dn(self)
+        return self._default_manager().dn(self)
 
     def save(self, commit: bool = True) -> None:
-        _meta = cast(Options, self._meta)
-        manager = cast(LdapManager, _meta.base_manager)
-        try:
-            manager.get_by_dn(cast(str, self.dn))
-        except self.DoesNotExist:
-            manager.add(self)
-        else:
-            manager.modify(self)
+        manager = self._default_manager()
+        # Do the existence check and the write over the same connection
+        with manager.connection_scope('write'):
+            try:
+                old = manager.get_by_dn(cast(str, self.dn))
+            except self.DoesNotExist:
+                manager.add(self)
+            else:
+                # Hand modify() the object we just fetched so that it doesn't
+                # have to fetch it again to work out what changed
+                manager.modify(self, old=old)
 
     def delete(self) -> None:
-        _meta = cast(Options, self._meta)
-        manager = cast(LdapManager, _meta.base_manager)
-        manager.delete_obj(self)
+        self._default_manager().delete_obj(self)
 
     def clean(self) -> None:
         """
@@ -324,12 +357,12 @@ class Model(metaclass=LdapModelBase):
 
     def clean_fields(self, exclude: List[str] = None) -> None:
         _meta = cast(Options, self._meta)
-        if exclude is None:
-            exclude = []
+        # We test every field against this, so make it a set
+        excluded = set(exclude) if exclude else set()
 
         errors: Dict[str, Any] = {}
         for f in _meta.fields:
-            if f.name in exclude:
+            if f.name in excluded:
                 continue
             raw_value = getattr(self, cast(str, f.name))
             if f.blank and raw_value == f.empty_values:
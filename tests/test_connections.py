@@ -0,0 +1,277 @@
+import unittest
+
+import django
+from django.conf import settings
+
+if not settings.configured:
+    settings.configure(
+        LDAP_SERVERS={
+            'default': {
+                'basedn': 'o=example,c=us',
+                'read': {
+                    'url': 'ldap://read.example.com',
+                    'user': 'cn=read,o=example,c=us',
+                    'password': 'password',
+                },
+                'write': {
+                    'url': 'ldap://write.example.com',
+                    'user': 'cn=write,o=example,c=us',
+                    'password': 'password',
+                },
+            }
+        }
+    )
+    django.setup()
+
+import ldap  # noqa:E402
+from ldap.controls import SimplePagedResultsControl  # noqa:E402
+import mock  # noqa:E402
+
+from ldaporm import fields  # noqa:E402
+from ldaporm import managers  # noqa:E402
+from ldaporm.models import Model  # noqa:E402
+
+
+class LDAPUser(Model):
+
+    uid = fields.CharField('Username', primary_key=True, max_length=50)
+    cn = fields.CharField('Full Name', max_length=100, null=True, blank=True)
+
+    class Meta:
+        basedn = 'ou=people,o=example,c=us'
+        objectclass = 'posixAccount'
+
+
+FRED = ('uid=fred,ou=people,o=example,c=us', {'uid': [b'fred'], 'cn': [b'Fred Flintstone']})
+BARNEY = ('uid=barney,ou=people,o=example,c=us', {'uid': [b'barney'], 'cn': [b'Barney Rubble']})
+
+
+class LdapConnectionTestCase(unittest.TestCase):
+    """
+    Patch ``ldap.initialize`` so that each new connection is a mocked
+    ``LDAPObject`` whose searches return ``self.entries``, and keep a list of
+    those connections in ``self.connections``.
+
+    Set ``self.search_error`` or ``self.delete_ext_error`` to an exception to
+    have ``search_s()`` or ``delete_ext_s()`` raise it.
+    """
+
+    def setUp(self):
+        self.manager = LDAPUser.objects
+        self.entries = [FRED, BARNEY]
+        self.search_error = None
+        self.delete_ext_error = None
+        self.connections = []
+        patcher = mock.patch('ldap.initialize', side_effect=self.make_connection)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        managers._pools.clear()
+        self.addCleanup(managers._pools.clear)
+
+    def tearDown(self):
+        # Don't let a failed test leave a connection behind for the next one
+        self.manager._ldap_objects.clear()
+        self.manager._ldap_pools.clear()
+        self.manager._ldap_keys.clear()
+
+    def make_connection(self, url):
+        conn = mock.Mock(name=url)
+        conn.url = url
+
+        def search_s(*args, **kwargs):
+            if self.search_error:
+                raise self.search_error
+            return list(self.entries)
+
+        def delete_ext_s(*args, **kwargs):
+            if self.delete_ext_error:
+                raise self.delete_ext_error
+
+        def search_ext(basedn, scope, searchfilter, attrlist=None, serverctrls=None, sizelimit=0):
+            conn.page_control = serverctrls[0]
+            return 1
+
+        def result3(msgid, all=1, timeout=None):
+            # Hand back one page of self.entries, with a cookie that says where
+            # the next page starts
+            start = int(conn.page_control.cookie or 0)
+            stop = start + conn.page_control.size
+            cookie = str(stop) if stop < len(self.entries) else ''
+            control = SimplePagedResultsControl(True, size=conn.page_control.size, cookie=cookie)
+            return ldap.RES_SEARCH_RESULT, self.entries[start:stop], msgid, [control]
+
+        conn.search_s.side_effect = search_s
+        conn.delete_ext_s.side_effect = delete_ext_s
+        conn.search_ext.side_effect = search_ext
+        conn.result3.side_effect = result3
+        self.connections.append(conn)
+        return conn
+
+    def urls(self):
+        return [conn.url for conn in self.connections]
+
+
+class TestConnectionScope(LdapConnectionTestCase):
+
+    def test_operations_in_a_scope_share_one_connection(self):
+        self.entries = [FRED]
+        with self.manager.connection_scope('read'):
+            self.manager.get(uid='fred')
+            self.manager.get_by_dn(FRED[0])
+        self.assertEqual(self.urls(), ['ldap://read.example.com'])
+        self.connections[0].unbind_s.assert_called_once_with()
+        self.assertFalse(self.manager.has_connection())
+
+    def test_write_scope_inside_read_scope_gets_its_own_connection(self):
+        with self.manager.connection_scope('read') as read_conn:
+            with self.manager.connection_scope('write') as write_conn:
+                self.assertIsNot(write_conn, read_conn)
+                self.assertEqual(write_conn.url, 'ldap://write.example.com')
+                self.assertIs(self.manager.connection, write_conn)
+            write_conn.unbind_s.assert_called_once_with()
+            self.assertIs(self.manager.connection, read_conn)
+            read_conn.unbind_s.assert_not_called()
+        read_conn.unbind_s.assert_called_once_with()
+        self.assertFalse(self.manager.has_connection())
+
+    def test_read_scope_inside_write_scope_reuses_the_write_connection(self):
+        with self.manager.connection_scope('write') as write_conn:
+            with self.manager.connection_scope('read') as read_conn:
+                self.assertIs(read_conn, write_conn)
+        self.assertEqual(self.urls(), ['ldap://write.example.com'])
+
+    def test_atomic_write_inside_read_scope_does_not_use_the_read_connection(self):
+        with self.manager.connection_scope('read') as read_conn:
+            self.manager.delete(uid='fred')
+            self.assertIs(self.manager.connection, read_conn)
+        read_conn.delete_ext_s.assert_not_called()
+        self.assertEqual(self.urls(), ['ldap://read.example.com', 'ldap://write.example.com'])
+        self.connections[1].delete_ext_s.assert_called_once()
+
+    def test_connect_refuses_to_replace_a_connection(self):
+        with self.manager.connection_scope('read') as read_conn:
+            with self.assertRaises(RuntimeError):
+                self.manager.connect('write')
+            self.assertIs(self.manager.connection, read_conn)
+
+    def test_set_connection_forgets_the_replaced_key(self):
+        other = mock.Mock()
+        with self.manager.connection_scope('read'):
+            self.manager.set_connection(other)
+            with self.manager.connection_scope('write') as conn:
+                self.assertIs(conn, other)
+
+    def test_authenticate_does_not_touch_the_scope_connection(self):
+        self.entries = [FRED]
+        with self.manager.connection_scope('read') as read_conn:
+            self.assertTrue(self.manager.authenticate('fred', 'secret'))
+            self.assertIs(self.manager.connection, read_conn)
+        user_conn = self.connections[1]
+        user_conn.simple_bind_s.assert_called_once_with(FRED[0], 'secret')
+        user_conn.unbind_s.assert_called_once_with()
+
+
+class TestSearchIter(LdapConnectionTestCase):
+
+    def test_writes_inside_the_loop_use_a_write_connection(self):
+        for dn, attrs in self.manager.search_iter('(objectclass=posixAccount)', ['uid']):
+            self.manager.delete(uid=attrs['uid'][0].decode())
+        read_conn = self.connections[0]
+        self.assertEqual(read_conn.url, 'ldap://read.example.com')
+        read_conn.delete_ext_s.assert_not_called()
+        read_conn.unbind_s.assert_called_once_with()
+        write_conns = self.connections[1:]
+        self.assertEqual([conn.url for conn in write_conns], ['ldap://write.example.com'] * 2)
+        for conn in write_conns:
+            conn.delete_ext_s.assert_called_once()
+        self.assertFalse(self.manager.has_connection())
+
+    def test_interleaved_iterators(self):
+        with mock.patch.object(self.manager, 'ldap_options', ['paged_search']):
+            a = self.manager.order_by().iterator(chunk_size=1)
+            b = self.manager.order_by().iterator(chunk_size=1)
+            self.assertEqual(next(a).uid, 'fred')
+            self.assertEqual(next(b).uid, 'fred')
+            self.assertEqual([user.uid for user in a], ['barney'])
+            self.assertEqual([user.uid for user in b], ['barney'])
+        self.assertEqual(len(self.connections), 2)
+        for conn in self.connections:
+            conn.unbind_s.assert_called_once_with()
+        self.assertFalse(self.manager.has_connection())
+
+
+class TestConnectionPool(LdapConnectionTestCase):
+
+    def setUp(self):
+        super().setUp()
+        patcher = mock.patch.dict(self.manager.config['read'], {'pool_size': 2})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_connection_is_released_after_an_ordinary_error(self):
+        self.search_error = ldap.NO_SUCH_OBJECT()
+        for _ in range(2):
+            with self.assertRaises(LDAPUser.DoesNotExist):
+                self.manager.get_by_dn('uid=wilma,ou=people,o=example,c=us')
+        self.assertEqual(self.urls(), ['ldap://read.example.com'])
+        self.connections[0].unbind_s.assert_not_called()
+        self.assertEqual(self.manager._get_pool('read')._idle.qsize(), 1)
+
+    def test_server_down_discards_the_connection(self):
+        self.entries = [FRED]
+        self.manager.get(uid='fred')
+        self.search_error = ldap.SERVER_DOWN()
+        with self.assertRaises(ldap.SERVER_DOWN):
+            self.manager.get(uid='fred')
+        self.assertEqual(len(self.connections), 1)
+        self.connections[0].unbind_s.assert_called_once_with()
+        self.assertEqual(self.manager._get_pool('read')._idle.qsize(), 0)
+
+    def test_search_iter_returns_its_connection_to_the_pool(self):
+        list(self.manager.search_iter('(objectclass=posixAccount)', ['uid']))
+        list(self.manager.search_iter('(objectclass=posixAccount)', ['uid']))
+        self.assertEqual(len(self.connections), 1)
+        self.connections[0].unbind_s.assert_not_called()
+
+
+class TestDelete(LdapConnectionTestCase):
+
+    def test_pk_delete_asserts_our_search_filter(self):
+        self.manager.delete(uid='fred')
+        conn = self.connections[0]
+        conn.search_s.assert_not_called()
+        args, kwargs = conn.delete_ext_s.call_args
+        self.assertEqual(args, ('uid=fred,ou=people,o=example,c=us',))
+        self.assertEqual(
+            [control.filterstr for control in kwargs['serverctrls']],
+            ['(&(objectclass=posixAccount)(uid=fred))']
+        )
+
+    def test_pk_delete_escapes_the_dn(self):
+        self.manager.delete(uid='fred,jr')
+        args, _ = self.connections[0].delete_ext_s.call_args
+        self.assertEqual(args, ('uid=fred\\,jr,ou=people,o=example,c=us',))
+
+    def test_assertion_failure_falls_back_to_searching(self):
+        # The entry at uid=fred is not one of ours, and there are no others
+        self.entries = []
+        self.delete_ext_error = ldap.ASSERTION_FAILED()
+        with self.assertRaises(LDAPUser.DoesNotExist):
+            self.manager.delete(uid='fred')
+        conn = self.connections[0]
+        conn.search_s.assert_called_once()
+        conn.delete_s.assert_not_called()
+
+    def test_object_below_our_basedn_is_found_by_searching(self):
+        sub_dn = 'uid=fred,ou=staff,ou=people,o=example,c=us'
+        self.entries = [(sub_dn, FRED[1])]
+        self.delete_ext_error = ldap.NO_SUCH_OBJECT()
+        self.manager.delete(uid='fred')
+        self.connections[0].delete_s.assert_called_once_with(sub_dn)
+
+    def test_delete_with_other_filters_searches_first(self):
+        self.entries = [FRED]
+        self.manager.delete(cn='Fred Flintstone')
+        conn = self.connections[0]
+        conn.delete_ext_s.assert_not_called()
+        conn.delete_s.assert_called_once_with(FRED[0])